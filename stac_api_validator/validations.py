@@ -1,27 +1,44 @@
 from typing import List, Tuple, Dict, Set
 from pystac_client import Client
+from pystac_client.stac_io import StacApiIO
 import logging
 import requests
 from typing import Callable
 import re
 import json
+import orjson
 import itertools
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from geometries import *
 
 # https://github.com/stac-utils/pystac/blob/4c7c775a6d0ca49d83dbec714855a189be759c8a/docs/concepts.rst#using-your-own-validator
 
 # resolve_stac_object
 
-core_cc_regex = re.compile('https://api\.stacspec\.org/.+/core')
+core_cc_regex = re.compile(r'\Ahttps://api\.stacspec\.org/[^/\s]+/core\Z')
 oaf_cc_regex = re.compile(
-    'https://api\.stacspec\.org/.+/ogcapi-features')
-search_cc_regex = re.compile('https://api\.stacspec\.org/.+/item-search')
+    r'\Ahttps://api\.stacspec\.org/[^/\s]+/ogcapi-features\Z')
+search_cc_regex = re.compile(r'\Ahttps://api\.stacspec\.org/[^/\s]+/item-search\Z')
+ogc_req_cc_prefix = "http://www.opengis.net/spec/ogcapi-features-1/1.0/req/"
 
 openapi_media_type = "application/vnd.oai.openapi+json;version=3.0"
 geojson_mt = 'application/geo+json'
 geojson_charset_mt = 'application/geo+json; charset=utf-8'
 
-valid_datetimes = [
+rfc3339_regex = re.compile(
+    r'\A\d{4}-\d{2}-\d{2}[Tt]\d{2}:\d{2}:\d{2}([.,]\d+)?([Zz]|[+-]\d{2}:\d{2})\Z')
+
+# a shared session keeps connections alive across the many probes made against the same API
+max_workers = 16
+session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                       max_retries=Retry(total=2, backoff_factor=0.2))
+session.mount("http://", _adapter)
+session.mount("https://", _adapter)
+
+valid_datetimes = (
     "1985-04-12T23:20:50.52Z",
     "1985-04-12T23:20:50,52Z",
     "1996-12-19T16:39:57-00:00",
@@ -56,9 +73,9 @@ valid_datetimes = [
     "2020-07-23T00:00:00.0123456Z",
     "2020-07-23T00:00:00.01234567Z",
     "2020-07-23T00:00:00.012345678Z",
-]
+)
 
-invalid_datetimes = [
+invalid_datetimes = (
     "1985-04-12",  # date only
     "1937-01-01T12:00:27.87+0100",  # invalid TZ format, no sep :
     "37-01-01T12:00:27.87Z",  # invalid year, must be 4 digits
@@ -73,6 +90,27 @@ invalid_datetimes = [
     "1985-04-12T23:20:50,Z",  # fractional sec , but no frac secs
     "1990-12-31T23:59:61Z",  # second > 60 w/o fractional seconds
     "1986-04-12T23:20:50.52Z/1985-04-12T23:20:50.52Z",
+)
+
+intersects_params = [point, linestring, polygon, polygon_with_hole, multipoint,
+                     multilinestring, multipolygon, geometry_collection]
+
+# geometries paired with their serialized form for GET queries
+intersects_get_serialized = [(p, json.dumps(p)) for p in intersects_params]
+
+# Valid 2D and 3D bboxes
+valid_bboxes = [[100.0, 0.0, 105.0, 1.0], [100.0, 0.0, 0.0, 105.0, 1.0, 1.0]]
+
+# bboxes paired with their comma-separated form for GET queries
+valid_bboxes_get_serialized = [(b, ",".join(str(c) for c in b)) for b in valid_bboxes]
+
+# Invalid bboxes - lat 1 > lat 2, and 1, 2, 3, 5, and 7 element array - labelled with why they
+# are invalid and paired with their form for GET queries
+invalid_bboxes_get_serialized = [
+    ("lat 1 > lat 2", [100.0, 1.0, 105.0, 0.0], "100.0, 1.0, 105.0, 0.0")
+] + [
+    (f"{len(b)} element array", b, ",".join(str(c) for c in b))
+    for b in [[0], [0, 0], [0, 0, 0], [0, 0, 0, 1, 1], [0, 0, 0, 1, 1, 1, 1]]
 ]
 
 
@@ -82,7 +120,7 @@ def validate_api(root_url: str, post: bool) -> Tuple[List[str], List[str]]:
     warnings: List[str] = []
     errors: List[str] = []
 
-    root = requests.get(root_url)
+    root = session.get(root_url)
 
     # todo: handle connection exception, etc.
     if root.status_code != 200:
@@ -90,7 +128,7 @@ def validate_api(root_url: str, post: bool) -> Tuple[List[str], List[str]]:
             f"root URL {root_url} returned status code {root.status_code}")
         return (warnings, errors)
 
-    root_body = root.json()
+    root_body = _parse_json(root)
 
     conforms_to = root_body.get("conformsTo")
     if not conforms_to:
@@ -100,15 +138,24 @@ def validate_api(root_url: str, post: bool) -> Tuple[List[str], List[str]]:
     if not root_body.get("links"):
         errors.append("/ : 'links' field must be defined and non-empty.")
 
-    if conforms_to and \
-       not any(core_cc_regex.match(x) for x in conforms_to) and \
-       not any(oaf_cc_regex.match(x) for x in conforms_to) and \
-       not any(search_cc_regex.match(x) for x in conforms_to):
+    # find the STAC API and OGC API 'req' conformance classes in a single pass over conformsTo
+    has_core = has_oaf = has_search = False
+    req_ccs = []
+    for cc in conforms_to or []:
+        if not has_core and core_cc_regex.match(cc):
+            has_core = True
+        elif not has_oaf and oaf_cc_regex.match(cc):
+            has_oaf = True
+        elif not has_search and search_cc_regex.match(cc):
+            has_search = True
+        elif cc.startswith(ogc_req_cc_prefix):
+            req_ccs.append(cc)
+
+    if conforms_to and not has_core and not has_oaf and not has_search:
         errors.append(
             "/ : 'conformsTo' must contain at least one STAC API conformance class.")
 
-    if conforms_to and \
-            (req_ccs := [x for x in conforms_to if x.startswith("http://www.opengis.net/spec/ogcapi-features-1/1.0/req/")]):
+    if req_ccs:
         warnings.append(
             f"/ : 'conformsTo' contains OGC API conformance classes using 'req' instead of 'conf': {req_ccs}.")
 
@@ -116,44 +163,129 @@ def validate_api(root_url: str, post: bool) -> Tuple[List[str], List[str]]:
     if errors:
         return (warnings, errors)
 
-    if any(core_cc_regex.match(x) for x in conforms_to):
+    # each conformance class is validated concurrently into its own warnings and errors,
+    # which are then merged in conformance class order
+    validators = []
+
+    if has_core:
         print("STAC API - Core conformance class found.")
-        validate_core(root_body, warnings, errors)
+        validators.append(lambda w, e: validate_core(root_body, w, e))
     else:
         errors.append(
             "/ : 'conformsTo' must contain STAC API - Core conformance class.")
 
-    if any(oaf_cc_regex.match(x) for x in conforms_to):
+    if has_oaf:
         print("STAC API - Features conformance class found.")
-        validate_oaf(root_body, warnings, errors)
+        validators.append(lambda w, e: validate_oaf(root_body, w, e))
 
-    if any(search_cc_regex.match(x) for x in conforms_to):
+    if has_search:
         print("STAC API - Item Search conformance class found.")
-        validate_search(root_body, post, warnings, errors)
+        validators.append(lambda w, e: validate_search(root_body, post, w, e))
+
+    def run_validator(validator) -> Tuple[List[str], List[str]]:
+        cc_warnings: List[str] = []
+        cc_errors: List[str] = []
+        validator(cc_warnings, cc_errors)
+        return (cc_warnings, cc_errors)
+
+    with ThreadPoolExecutor(max_workers=len(validators) or 1) as executor:
+        for (cc_warnings, cc_errors) in executor.map(run_validator, validators):
+            warnings += cc_warnings
+            errors += cc_errors
 
     if not errors:
         try:
-            catalog = Client.open(root_url)
+            # build the Client from the landing page already fetched, rather than fetching it again,
+            # reading children through StacApiIO and setting the root the way Client.open does
+            catalog = Client.from_dict(root_body, href=root_url, migrate=True)
+            catalog._stac_io = StacApiIO()
+            root_link = catalog.get_root_link()
+            if root_link is not None and not root_link.is_resolved() and \
+                    root_link.get_absolute_href() == root_url:
+                catalog.set_root(catalog)
             catalog.validate()
-            for collection in catalog.get_children():
-                collection.validate()
+            # children are fetched one at a time, and each is validated while the next is fetched
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(lambda c: c.validate(), catalog.get_children()))
         except Exception as e:
             errors.append(str(e))
 
     return (warnings, errors)
 
 
-def href_for(links: List, key: str) -> Dict[str, str]:
-    return next((link for link in links if link.get("rel") == key), None)
+def _parse_json(r: requests.Response):
+    return orjson.loads(r.content)
+
+
+def _search(search_url: str, method: str, params: Dict,
+            stream: bool = False) -> requests.Response:
+    if method == "GET":
+        return session.get(search_url, params=params, stream=stream)
+    else:
+        return session.post(search_url, json=params, stream=stream)
+
+
+# issue (method, params, ...) search queries concurrently, checking each response in its worker with
+# check(r, query, errors) so that its body can be freed before the remaining responses arrive, and
+# return the errors in query order
+def _check_searches_concurrently(search_url: str, queries: List[Tuple],
+                                 check: Callable[[requests.Response, Tuple, List[str]], None]
+                                 ) -> List[str]:
+    def run(query: Tuple) -> List[str]:
+        query_errors: List[str] = []
+        check(_search(search_url, query[0], query[1]), query, query_errors)
+        return query_errors
+
+    errors: List[str] = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for query_errors in executor.map(run, queries):
+            errors += query_errors
+    return errors
+
+
+# error bodies up to this size are read so the connection goes back to the session pool; closing
+# a response with an unread body drops its connection
+max_drained_body_size = 64 * 1024
+
+
+def _search_status_code(search_url: str, method: str, params: Dict) -> int:
+    with _search(search_url, method, params, stream=True) as r:
+        content_length = r.headers.get("content-length")
+        if content_length is None or \
+                (content_length.isdigit() and int(content_length) <= max_drained_body_size):
+            read = 0
+            for chunk in r.iter_content(chunk_size=8192):
+                read += len(chunk)
+                if read > max_drained_body_size:
+                    break
+        return r.status_code
+
+
+# issue (method, params) search queries concurrently, returning only their status codes in
+# query order, without downloading the response bodies
+def _search_status_codes_concurrently(search_url: str,
+                                      queries: List[Tuple[str, Dict]]) -> List[int]:
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda q: _search_status_code(search_url, *q), queries))
+
+
+# index links by rel, keeping the first link for each rel
+def index_links(links: List) -> Dict[str, Dict]:
+    links_by_rel = {}
+    for link in links:
+        rel = link.get("rel")
+        if rel not in links_by_rel:
+            links_by_rel[rel] = link
+    return links_by_rel
 
 
 def validate_core(root_body: Dict, warnings: List[str],
                   errors: List[str]) -> int:
 
-    links = root_body.get("links")
+    links_by_rel = index_links(root_body.get("links"))
 
     # Link rel=root
-    root = href_for(links, "root")
+    root = links_by_rel.get("root")
     if root is not None:
         if root.get("type") != "application/json":
             errors.append("root type is not application/json")
@@ -161,7 +293,7 @@ def validate_core(root_body: Dict, warnings: List[str],
         warnings.append("/ : Link[rel=root] should exist")
 
     # Link rel=self
-    _self = href_for(links, "self")
+    _self = links_by_rel.get("self")
     if _self is not None:
         if _self.get("type") != "application/json":
             errors.append("self type is not application/json")
@@ -169,7 +301,7 @@ def validate_core(root_body: Dict, warnings: List[str],
         warnings.append("/ : Link[rel=self] should exist")
 
     # Link rel=service-desc
-    service_desc = href_for(links, "service-desc")
+    service_desc = links_by_rel.get("service-desc")
     if not service_desc:
         warnings.append("/ : Link[rel=service-desc] should exist")
     else:
@@ -177,11 +309,10 @@ def validate_core(root_body: Dict, warnings: List[str],
             errors.append(
                 f"/ : Link[rel=service-desc] should have media_type '{openapi_media_type}'', actually '{service_desc.media_type}'")
 
-        r_service_desc = requests.get(service_desc["href"])
+        r_service_desc = session.get(service_desc["href"])
 
-        errors += validate(
-            "/ : Link[service-desc] must return 200",
-            lambda: r_service_desc.status_code == 200)
+        if r_service_desc.status_code != 200:
+            errors.append("/ : Link[service-desc] must return 200")
 
         if (ct := r_service_desc.headers.get('content-type')) == openapi_media_type:
             pass
@@ -190,24 +321,23 @@ def validate_core(root_body: Dict, warnings: List[str],
                 f"service-desc ({service_desc}): should have content-type header '{openapi_media_type}'', actually '{ct}'")
 
         try:
-            r_service_desc.json()
-        except json.decoder.JSONDecodeError as e:
+            _parse_json(r_service_desc)
+        except orjson.JSONDecodeError as e:
             errors.append(
                 f"service-desc ({service_desc}): should return JSON, instead got non-JSON text")
 
     # Link rel=service-doc
-    service_doc = href_for(links, "service-doc")
+    service_doc = links_by_rel.get("service-doc")
     if not service_doc:
         warnings.append("/ : Link[rel=service-doc] should exist")
     else:
         if service_doc.get("type") != "text/html":
             errors.append("service-doc type is not text/html")
 
-        r_service_doc = requests.get(service_doc["href"])
+        r_service_doc = session.get(service_doc["href"])
 
-        errors += validate(
-            "/ : Link[service-doc] must return 200",
-            lambda: r_service_doc.status_code == 200)
+        if r_service_doc.status_code != 200:
+            errors.append("/ : Link[service-doc] must return 200")
 
         if (ct := r_service_doc.headers.get('content-type')).startswith('text/html'):
             pass
@@ -225,17 +355,14 @@ def validate_core(root_body: Dict, warnings: List[str],
 def validate_oaf(root_body: Dict, warnings: List[str],
                  errors: List[str]) -> int:
 
-    links = root_body.get("links")
-    conformance = href_for(links, "conformance")
-    errors += validate(
-        "/ Link[rel=conformance] should href /conformance",
-        lambda: conformance and conformance["href"].endswith("/conformance")
-    )
+    links_by_rel = index_links(root_body.get("links"))
+    conformance = links_by_rel.get("conformance")
+    if not (conformance and conformance["href"].endswith("/conformance")):
+        errors.append("/ Link[rel=conformance] should href /conformance")
 
-    r_conformance = requests.get(conformance["href"])
-    errors += validate(
-        "conformance must return 200",
-        lambda: r_conformance.status_code == 200)
+    r_conformance = session.get(conformance["href"])
+    if r_conformance.status_code != 200:
+        errors.append("conformance must return 200")
 
     if (ct := r_conformance.headers.get('content-type')) == 'application/json':
         pass
@@ -244,46 +371,43 @@ def validate_oaf(root_body: Dict, warnings: List[str],
             f"conformance ({conformance}): should have content-type header 'application/json', actually '{ct}'")
 
     try:
-        conformance_json = r_conformance.json()
-        warnings += validate(
-            "Landing Page conforms to and conformance conformsTo should be the same",
-            lambda: root_body.get("conformsTo") == conformance_json['conformsTo'])
-    except json.decoder.JSONDecodeError as e:
+        conformance_json = _parse_json(r_conformance)
+        if root_body.get("conformsTo") != conformance_json['conformsTo']:
+            warnings.append(
+                "Landing Page conforms to and conformance conformsTo should be the same")
+    except orjson.JSONDecodeError as e:
         errors.append(
             f"service-desc ({conformance}): should return JSON, instead got non-JSON text")
 
-    errors += validate(
-        "/: Link[rel=data] should href /collections",
-        lambda: href_for(links, "data")
-    )
+    if not links_by_rel.get("data"):
+        errors.append("/: Link[rel=data] should href /collections")
 
     # this is hard to figure out, since it's likely a mistake, but most apis can't undo it for
     # backwards-compat reasons
-    warnings += validate(
-        "/ Link[rel=collections] is a non-standard relation. Use Link[rel=data instead]",
-        lambda: not href_for(links, "collections")
-    )
+    if links_by_rel.get("collections"):
+        warnings.append(
+            "/ Link[rel=collections] is a non-standard relation. Use Link[rel=data instead]")
 
 
 def validate_search(root_body: Dict, post: bool, warnings: List[str],
                     errors: List[str]) -> None:
 
-    links = root_body.get("links")
-    root = href_for(links, "self")["href"]
-    search = href_for(links, "search")
+    links_by_rel = index_links(root_body.get("links"))
+    root = links_by_rel.get("self")["href"]
+    search = links_by_rel.get("search")
     if not search:
         errors.append(
             f"/: Link[rel=search] should exist when Item Search is implemented")
         return
 
-    collections = href_for(links, "data")
+    collections = links_by_rel.get("data")
     if collections:
         collections_url = collections.get("href")
     else:
         collections_url = f"{root}/collections"
 
     search_url = search["href"]
-    r = requests.get(search_url)
+    r = session.get(search_url)
     content_type: str = r.headers.get('content-type')
     if (content_type == geojson_mt or content_type == geojson_charset_mt):
         pass
@@ -291,93 +415,107 @@ def validate_search(root_body: Dict, post: bool, warnings: List[str],
         errors.append(
             f"Search ({search_url}): should have content-type header '{geojson_mt}'', actually '{content_type}'")
 
-    errors += validate(
-        f"Search({search_url}): should return 200",
-        lambda: r.status_code == 200)
+    if r.status_code != 200:
+        errors.append(f"Search({search_url}): should return 200")
 
     # todo: validate geojson, not just json
+    # the Items from this response are reused as samples by the validators below
     try:
-        r.json()
-    except json.decoder.JSONDecodeError as e:
+        sample_features = _parse_json(r).get("features") or []
+    except orjson.JSONDecodeError as e:
         errors.append(
             f"Search ({search_url}): should return JSON, instead got non-JSON text")
+        sample_features = []
+
+    _collections = _parse_json(session.get(collections_url))["collections"]
 
     validate_search_limit(search_url, post, errors)
     validate_search_bbox(search_url, post, errors)
-    validate_search_datetime(search_url, errors)
-    validate_search_ids(search_url, post, warnings, errors)
-    validate_search_collections(search_url, collections_url, post, errors)
-    validate_search_intersects(search_url, errors)
+    validate_search_datetime(search_url, errors, sample_features)
+    validate_search_ids(search_url, post, warnings, errors, sample_features)
+    validate_search_collections(search_url, _collections, post, errors)
+    validate_search_intersects(search_url, post, errors)
 
 
 def validate_search_datetime(
     search_url: str,
-    errors: List[str]
+    errors: List[str],
+    sample_features: List[Dict]
 ):
-    # find an Item and try to use its datetime value in a query
-    r = requests.get(search_url)
-    dt = r.json()["features"][0]["properties"]["datetime"]
-    r = requests.get(search_url, params={"datetime": dt})
-    if r.status_code != 200:
-        errors.append(
-            f"Search with datetime={dt} extracted from an Item returned status code {r.status_code}")
-    elif len(r.json()["features"]) == 0:
-        errors.append(
-            f"Search with datetime={dt} extracted from an Item returned no results.")
+    # use the datetime value of a sample Item in a query, if it has a single RFC 3339 datetime
+    # rather than a null datetime with a start_datetime and end_datetime
+    sample_dts = []
+    if sample_features:
+        dt = sample_features[0]["properties"].get("datetime")
+        if dt is not None:
+            if isinstance(dt, str) and rfc3339_regex.match(dt):
+                sample_dts.append(dt)
+            else:
+                errors.append(
+                    f"Item {sample_features[0].get('id')} datetime {dt!r} is not an RFC 3339 datetime")
 
-    for dt in valid_datetimes:
-        r = requests.get(search_url, params={"datetime": dt})
-        if r.status_code != 200:
-            errors.append(
+    # (method, params, whether the datetime was extracted from an Item)
+    queries = [("GET", {"datetime": dt}, True) for dt in sample_dts] + \
+        [("GET", {"datetime": dt}, False) for dt in valid_datetimes]
+
+    def check(r, query, query_errors):
+        _, params, from_item = query
+        dt = params["datetime"]
+        if from_item:
+            if r.status_code != 200:
+                query_errors.append(
+                    f"Search with datetime={dt} extracted from an Item returned status code {r.status_code}")
+            elif len(_parse_json(r)["features"]) == 0:
+                query_errors.append(
+                    f"Search with datetime={dt} extracted from an Item returned no results.")
+        elif r.status_code != 200:
+            query_errors.append(
                 f"Search with datetime={dt} returned status code {r.status_code}")
-            continue
-        try:
-            r.json()
-        except json.decoder.JSONDecodeError:
-            errors.append(
-                f"Search with datetime={dt} returned non-json response")
+        else:
+            try:
+                _parse_json(r)
+            except orjson.JSONDecodeError:
+                query_errors.append(
+                    f"Search with datetime={dt} returned non-json response")
+
+    errors += _check_searches_concurrently(search_url, queries, check)
+
+    invalid_status_codes = _search_status_codes_concurrently(
+        search_url,
+        [("GET", {"datetime": dt}) for dt in invalid_datetimes])
 
-    for dt in invalid_datetimes:
-        r = requests.get(search_url, params={"datetime": dt})
-        if r.status_code != 400:
+    for dt, status_code in zip(invalid_datetimes, invalid_status_codes):
+        if status_code != 400:
             errors.append(
-                f"Search with datetime={dt} returned status code {r.status_code} instead of 400")
-            continue
+                f"Search with datetime={dt} returned status code {status_code} instead of 400")
 
 
 def validate_search_intersects(
     search_url: str,
     post: bool,
-    errors: List[str] = []
+    errors: List[str]
 ):
+    # (method, params, serialized geometry)
+    queries = []
+    for param, param_json in intersects_get_serialized:
+        queries.append(("GET", {"intersects": param_json}, param_json))
+        if post:
+            queries.append(("POST", {"intersects": param}, param_json))
 
-    intersects_params = [point, linestring, polygon, polygon_with_hole, multipoint,
-                      multilinestring, multipolygon, geometry_collection]
-
-    for param in intersects_params:
-        # Valid GET query
-        r = requests.get(search_url, params={"intersects": json.dumps(param)})
+    def check(r, query, query_errors):
+        method, _, param_json = query
+        param_str = f"intersects={param_json}" if method == "GET" else f"intersects:{param_json}"
         if r.status_code != 200:
-            errors.append(
-                f"GET Search with intersects={param} returned status code {r.status_code}")
+            query_errors.append(
+                f"{method} Search with {param_str} returned status code {r.status_code}")
         else:
             try:
-                r.json()
-            except json.decoder.JSONDecodeError:
-                errors.append(
-                    f"GET Search with intersects={param} returned non-json response: {r.text}")
-        if post:
-            # Valid POST query
-            r = requests.post(search_url, json={"intersects": param})
-            if r.status_code != 200:
-                errors.append(
-                    f"POST Search with intersects:{param} returned status code {r.status_code}")
-            else:
-                try:
-                    r.json()
-                except json.decoder.JSONDecodeError:
-                    errors.append(
-                        f"POST Search with intersects:{param} returned non-json response: {r.text}")
+                _parse_json(r)
+            except orjson.JSONDecodeError:
+                query_errors.append(
+                    f"{method} Search with {param_str} returned non-json response: {r.text}")
+
+    errors += _check_searches_concurrently(search_url, queries, check)
 
 
 def validate_search_bbox(
@@ -385,103 +523,63 @@ def validate_search_bbox(
     post: bool,
     errors: List[str]
 ):
-    # Valid GET query
-    param = "100.0,0.0,105.0,1.0"
-    r = requests.get(search_url, params={"bbox": param})
-    if r.status_code != 200:
-        errors.append(
-            f"GET Search with bbox={param} returned status code {r.status_code}")
-    else:
-        try:
-            r.json()
-        except json.decoder.JSONDecodeError:
-            errors.append(
-                f"GET Search with bbox={param} returned non-json response: {r.text}")
+    valid_queries = []
+    for bbox, bbox_csv in valid_bboxes_get_serialized:
+        valid_queries.append(("GET", {"bbox": bbox_csv}))
+        if post:
+            valid_queries.append(("POST", {"bbox": bbox}))
 
+    # (method, params, reason it is invalid)
+    invalid_queries = [("GET", {"bbox": "[100.0, 0.0, 105.0, 1.0]"}, "coordinates in brackets")]
     if post:
-        # Valid POST query
-        param = [100.0, 0.0, 105.0, 1.0]
-        r = requests.post(search_url, json={"bbox": param})
-        if r.status_code != 200:
-            errors.append(
-                f"POST Search with bbox:{param} returned status code {r.status_code}")
-        else:
-            try:
-                r.json()
-            except json.decoder.JSONDecodeError:
-                errors.append(
-                    f"POST Search with bbox:{param} returned non-json response: {r.text}")
-
-    # Valid 3D GET query
-    param = "100.0,0.0,0.0,105.0,1.0,1.0"
-    r = requests.get(search_url, params={"bbox": param})
-    if r.status_code != 200:
-        errors.append(
-            f"GET Search with bbox={param} returned status code {r.status_code}")
-    else:
-        try:
-            r.json()
-        except json.decoder.JSONDecodeError:
-            errors.append(
-                f"GET with bbox={param} returned non-json response: {r.text}")
+        invalid_queries.append(
+            ("POST", {"bbox": "100.0, 0.0, 105.0, 1.0"}, "CSV string of coordinates"))
+    for label, bbox, bbox_get in invalid_bboxes_get_serialized:
+        invalid_queries.append(("GET", {"bbox": bbox_get}, label))
+        if post:
+            invalid_queries.append(("POST", {"bbox": bbox}, label))
 
-    if post:
-        # Valid 3D POST query
-        param = [100.0, 0.0, 0.0, 105.0, 1.0, 1.0]
-        r = requests.post(search_url, json={"bbox": param})
+    def check(r, query, query_errors):
+        method, params = query
         if r.status_code != 200:
-            errors.append(
-                f"POST Search with bbox:{param} returned status code {r.status_code}")
+            query_errors.append(
+                f"{method} Search with {params} returned status code {r.status_code}")
         else:
             try:
-                r.json()
-            except json.decoder.JSONDecodeError:
-                errors.append(
-                    f"POST with bbox:{param} returned non-json response: {r.text}")
+                _parse_json(r)
+            except orjson.JSONDecodeError:
+                query_errors.append(
+                    f"{method} Search with {params} returned non-json response: {r.text}")
 
-    # Invalid GET query with coordinates in brackets
-    param = "[100.0, 0.0, 105.0, 1.0]"
-    r = requests.get(search_url, params={"bbox": param})
-    if r.status_code != 400:
-        errors.append(
-            f"GET Search with bbox={param} returned status code {r.status_code}, instead of 400")
+    errors += _check_searches_concurrently(search_url, valid_queries, check)
 
-    if post:
-        # Invalid POST query with CSV string of coordinates
-        param = "100.0, 0.0, 105.0, 1.0"
-        r = requests.post(search_url, json={"bbox": param})
-        if r.status_code != 400:
-            errors.append(
-                f"POST Search with bbox:\"{param}\" returned status code {r.status_code}, instead of 400")
+    invalid_status_codes = _search_status_codes_concurrently(
+        search_url, [(method, params) for (method, params, _) in invalid_queries])
 
-    # Invalid bbox - lat 1 > lat 2
-    param = "100.0, 1.0, 105.0, 0.0"
-    r = requests.get(search_url, params={"bbox": param})
-    if r.status_code != 400:
-        errors.append(
-            f"GET Search with bbox=param (lat 1 > lat 2) returned status code {r.status_code}, instead of 400")
-
-    if post:
-        param = [100.0, 1.0, 105.0, 0.0]
-        r = requests.post(search_url, json={"bbox": param})
-        if r.status_code != 400:
+    for (method, params, label), status_code in zip(invalid_queries, invalid_status_codes):
+        if status_code != 400:
             errors.append(
-                f"POST Search with bbox: {param} (lat 1 > lat 2) returned status code {r.status_code}, instead of 400")
+                f"{method} Search with {params} ({label}) returned status code {status_code}, instead of 400")
 
-    # Invalid bbox - 1, 2, 3, 5, and 7 element array
-    bboxes = [[0], [0, 0], [0, 0, 0], [0, 0, 0, 1, 1], [0, 0, 0, 1, 1, 1, 1]]
 
-    for bbox in bboxes:
-        param = ",".join((str(c) for c in bbox))
-        r = requests.get(search_url, params={"bbox": param})
-        if r.status_code != 400:
-            errors.append(
-                f"GET Search with bbox={param} returned status code {r.status_code}, instead of 400")
-        if post:
-            r = requests.post(search_url, json={"bbox": bbox})
-            if r.status_code != 400:
+def _validate_search_limit_request(
+    r,
+    method: str,
+    params: Dict,
+    errors: List[str]
+):
+    if r.status_code != 200:
+        errors.append(
+            f"{method} Search with {params} returned status code {r.status_code}")
+    else:
+        try:
+            features = _parse_json(r).get("features") or []
+            if len(features) > params["limit"]:
                 errors.append(
-                    f"POST Search with bbox:{bbox} returned status code {r.status_code}, instead of 400")
+                    f"{method} Search with {params} returned more than {params['limit']} results")
+        except orjson.JSONDecodeError:
+            errors.append(
+                f"{method} Search with {params} returned non-json response: {r.text}")
 
 
 def validate_search_limit(
@@ -490,56 +588,27 @@ def validate_search_limit(
     errors: List[str]
 ):
     valid_limits = [1, 2, 10, 10000]
-    for limit in valid_limits:
-        # Valid GET query
-        params = {"limit": limit}
-        r = requests.get(search_url, params=params)
-        if r.status_code != 200:
-            errors.append(
-                f"GET Search with {params} returned status code {r.status_code}")
-        else:
-            try:
-                body = r.json()
-                items = body.get("items")
-                if items and len(items) <= 1:
-                    errors.append(
-                        f"POST Search with {params} returned fewer than 1 result")
-
-            except json.decoder.JSONDecodeError:
-                errors.append(
-                    f"GET Search with {params} returned non-json response: {r.text}")
-
-        if post:
-            # Valid POST query
-            r = requests.post(search_url, json=params)
-            if r.status_code != 200:
-                errors.append(
-                    f"POST Search with {params} returned status code {r.status_code}")
-            else:
-                try:
-                    items = body.get("items")
-                    if items and len(items) <= 1:
-                        errors.append(
-                            f"POST Search with {params} returned fewer than 1 result")
-                except json.decoder.JSONDecodeError:
-                    errors.append(
-                        f"POST Search with {params} returned non-json response: {r.text}")
-
     invalid_limits = [-1, 0, 10001]
-    for limit in invalid_limits:
-        # Valid GET query
-        params = {"limit": limit}
-        r = requests.get(search_url, params=params)
-        if r.status_code != 400:
+    methods = ["GET", "POST"] if post else ["GET"]
+
+    valid_queries = [(method, {"limit": limit}) for limit in valid_limits for method in methods]
+    invalid_queries = [(method, {"limit": limit}) for limit in invalid_limits for method in methods]
+    errors += _check_searches_concurrently(
+        search_url,
+        valid_queries,
+        lambda r, query, query_errors: _validate_search_limit_request(
+            r,
+            method=query[0],
+            params=query[1],
+            errors=query_errors
+        ))
+
+    invalid_status_codes = _search_status_codes_concurrently(search_url, invalid_queries)
+
+    for (method, params), status_code in zip(invalid_queries, invalid_status_codes):
+        if status_code != 400:
             errors.append(
-                f"GET Search with {params} returned status code {r.status_code}, should be 400")
-
-        if post:
-            # Valid POST query
-            r = requests.post(search_url, json=params)
-            if r.status_code != 400:
-                errors.append(
-                    f"POST Search with {params} returned status code {r.status_code}, should be 400")
+                f"{method} Search with {params} returned status code {status_code}, should be 400")
 
 
 def _validate_search_ids_request(
@@ -549,16 +618,17 @@ def _validate_search_ids_request(
     params: Dict,
     errors: List[str]
 ):
+    id_set = frozenset(item_ids)
     if r.status_code != 200:
         errors.append(
             f"{method} Search with {params} returned status code {r.status_code}")
     else:
         try:
-            items = r.json().get("features")
-            if len(items) != len(list(filter(lambda x: x.get("id") in item_ids, items))):
+            items = _parse_json(r).get("features")
+            if not all(x.get("id") in id_set for x in items):
                 errors.append(
                     f"{method} Search with {params} returned items with ids other than specified one")
-        except json.decoder.JSONDecodeError:
+        except orjson.JSONDecodeError:
             errors.append(
                 f"{method} Search with {params} returned non-json response: {r.text}")
 
@@ -572,7 +642,7 @@ def _validate_search_ids_with_ids(
     get_params = {"ids": ",".join(item_ids)}
 
     _validate_search_ids_request(
-        requests.get(search_url, params=get_params),
+        session.get(search_url, params=get_params),
         item_ids=item_ids,
         method="GET",
         params=get_params,
@@ -582,7 +652,7 @@ def _validate_search_ids_with_ids(
     if post:
         post_params = {"ids": item_ids}
         _validate_search_ids_request(
-            requests.post(search_url, json=post_params),
+            session.post(search_url, json=post_params),
             item_ids=item_ids,
             method="POST",
             params=post_params,
@@ -594,16 +664,18 @@ def validate_search_ids(
     search_url: str,
     post: bool,
     warnings: List[str],
-    errors: List[str]
+    errors: List[str],
+    sample_features: List[Dict]
 ):
-    r = requests.get(f"{search_url}?limit=10")
-    items = r.json().get("features")
+    items = sample_features[:10]
     if items:
-        _validate_search_ids_with_ids(search_url, [items[0].get("id")], post, errors)
-        _validate_search_ids_with_ids(
-            search_url, [items[0].get("id"), items[1].get("id")], post, errors)
-        _validate_search_ids_with_ids(
-            search_url, [i["id"] for i in items], post, errors)
+        _validate_search_ids_with_ids(search_url, [items[0]["id"]], post, errors)
+        if len(items) >= 2:
+            _validate_search_ids_with_ids(
+                search_url, [items[0]["id"], items[1]["id"]], post, errors)
+        if len(items) > 2:
+            _validate_search_ids_with_ids(
+                search_url, [i["id"] for i in items], post, errors)
     else:
         warnings.append(f"Get Search with no parameters returned zero results")
 
@@ -615,68 +687,47 @@ def _validate_search_collections_request(
     params: Dict,
     errors: List[str]
 ):
+    coll_set = frozenset(coll_ids)
     if r.status_code != 200:
         errors.append(
             f"{method} Search with {params} returned status code {r.status_code}")
     else:
         try:
-            items = r.json().get("features")
-            if len(items) != len(list(filter(lambda x: x.get("collection") in coll_ids, items))):
+            items = _parse_json(r).get("features")
+            if not all(x.get("collection") in coll_set for x in items):
                 errors.append(
                     f"{method} Search with {params} returned items with ids other than specified one")
-        except json.decoder.JSONDecodeError:
+        except orjson.JSONDecodeError:
             errors.append(
                 f"{method} Search with {params} returned non-json response: {r.text}")
 
 
-def _validate_search_collections_with_ids(
-    search_url,
-    coll_ids: List[str],
-    post: bool,
-    errors: List[str]
-):
-    get_params = {"collections": ",".join(coll_ids)}
-    _validate_search_collections_request(
-        requests.get(search_url, params=get_params),
-        coll_ids=coll_ids,
-        method="GET",
-        params=get_params,
-        errors=errors
-    )
-
-    if post:
-        post_params = {"collections": coll_ids}
-        _validate_search_collections_request(
-            requests.post(search_url, json=post_params),
-            coll_ids=coll_ids,
-            method="POST",
-            params=post_params,
-            errors=errors
-        )
-
-
 def validate_search_collections(
     search_url: str,
-    collections_url: str,
+    _collections: List[Dict],
     post: bool,
     errors: List[str]
 ):
-    _collections = requests.get(collections_url).json()["collections"]
     collection_ids = [x["id"] for x in _collections]
 
-    _validate_search_collections_with_ids(
-        search_url, collection_ids, post, errors)
-
-    for cid in collection_ids:
-        _validate_search_collections_with_ids(
-            search_url, [cid], post, errors)
+    # all collections, each collection individually, and the first three collections,
+    # all requested and checked in one concurrent batch
+    coll_ids_list = [collection_ids] + [[cid] for cid in collection_ids] + \
+        [list(itertools.islice(collection_ids, 3))]
 
-    _validate_search_collections_with_ids(
-        search_url, list(itertools.islice(collection_ids, 3)), post, errors)
-
-
-def validate(error_str: str, p: Callable[[], bool]) -> List[str]:
-    if not p():
-        return [error_str]
-    else:
-        return []
+    queries = []
+    for coll_ids in coll_ids_list:
+        queries.append(("GET", {"collections": ",".join(coll_ids)}, coll_ids))
+        if post:
+            queries.append(("POST", {"collections": coll_ids}, coll_ids))
+
+    errors += _check_searches_concurrently(
+        search_url,
+        queries,
+        lambda r, query, query_errors: _validate_search_collections_request(
+            r,
+            coll_ids=query[2],
+            method=query[0],
+            params=query[1],
+            errors=query_errors
+        ))